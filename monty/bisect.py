@@ -10,11 +10,21 @@ lists.
 from __future__ import annotations
 
 import bisect as bs
-from typing import TYPE_CHECKING
+import math
+from collections import namedtuple
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Literal
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
 
 if TYPE_CHECKING:
     from typing import Optional
 
+    from numpy.typing import ArrayLike
+
 __author__ = "Matteo Giantomassi"
 __copyright__ = "Copyright 2013, The Materials Virtual Lab"
 __version__ = "0.1"
@@ -23,43 +33,361 @@ __email__ = "gmatteo@gmail.com"
 __date__ = "11/09/14"
 
 
+# Below this size bisect.bisect_* on an ndarray is as fast as a call into
+# the compiled kernels, so the dispatch is not worth it.
+_NJIT_MIN_SIZE = 256
+_F64 = np.dtype(np.float64) if np is not None else None
+
+
+@lru_cache(maxsize=None)
+def _load_njit():
+    """
+    Import the numba kernels on first use, as importing numba is slow.
+    Returns None if numba is not installed.
+    """
+    try:
+        from monty import _bisect_njit
+    except ImportError:
+        return None
+    return _bisect_njit
+
+
+def _is_f64_array(a: object) -> bool:
+    """Whether a can be handled by the numba kernels."""
+    # Identity check on the dtype, as dtype.__eq__ is comparatively slow
+    return (
+        np is not None and isinstance(a, np.ndarray) and a.ndim == 1 and a.dtype is _F64
+    )
+
+
+def bisect_left_fast(a: list[float], x: float) -> int:
+    """
+    Equivalent of bisect.bisect_left. If numba is installed and a is a
+    large 1D float64 ndarray, a compiled branchless kernel is used instead.
+    """
+    # Lists are by far the most common input, so they skip the dispatch
+    if type(a) is not list and len(a) >= _NJIT_MIN_SIZE and _is_f64_array(a):
+        kernels = _load_njit()
+        if kernels is not None:
+            return kernels.bisect_left(a, x)
+    return bs.bisect_left(a, x)
+
+
+def bisect_right_fast(a: list[float], x: float) -> int:
+    """
+    Equivalent of bisect.bisect_right. If numba is installed and a is a
+    large 1D float64 ndarray, a compiled branchless kernel is used instead.
+    """
+    # Lists are by far the most common input, so they skip the dispatch
+    if type(a) is not list and len(a) >= _NJIT_MIN_SIZE and _is_f64_array(a):
+        kernels = _load_njit()
+        if kernels is not None:
+            return kernels.bisect_right(a, x)
+    return bs.bisect_right(a, x)
+
+
 def index(a: list[float], x: float, atol: Optional[float] = None) -> int:
     """Locate the leftmost value exactly equal to x."""
-    i = bs.bisect_left(a, x)
-    if i != len(a):
-        if atol is None:
-            if a[i] == x:
-                return i
-        elif abs(a[i] - x) < atol:
+    # Out-of-range queries (and single-element sequences) are resolved with
+    # bound comparisons instead of a bisection. The comparisons mirror those
+    # made by bisect_left/bisect_right so that results are identical.
+    if not len(a) or a[-1] < x:
+        raise ValueError
+    i = bisect_left_fast(a, x) if a[0] < x else 0
+    if atol is None:
+        if a[i] == x:
             return i
+    elif abs(a[i] - x) < atol:
+        return i
     raise ValueError
 
 
 def find_lt(a: list[float], x: float) -> int:
     """Find rightmost value less than x."""
-    if i := bs.bisect_left(a, x):
-        return i - 1
-    raise ValueError
+    if not len(a) or not a[0] < x:
+        raise ValueError
+    if a[-1] < x:
+        return len(a) - 1
+    return bisect_left_fast(a, x) - 1
 
 
 def find_le(a: list[float], x: float) -> int:
     """Find rightmost value less than or equal to x."""
-    if i := bs.bisect_right(a, x):
-        return i - 1
-    raise ValueError
+    if not len(a) or x < a[0]:
+        raise ValueError
+    if not x < a[-1]:
+        return len(a) - 1
+    return bisect_right_fast(a, x) - 1
 
 
 def find_gt(a: list[float], x: float) -> int:
     """Find leftmost value greater than x."""
-    i = bs.bisect_right(a, x)
-    if i != len(a):
-        return i
-    raise ValueError
+    if not len(a) or not x < a[-1]:
+        raise ValueError
+    if x < a[0]:
+        return 0
+    return bisect_right_fast(a, x)
 
 
 def find_ge(a: list[float], x: float) -> int:
     """Find leftmost item greater than or equal to x."""
-    i = bs.bisect_left(a, x)
-    if i != len(a):
+    if not len(a) or a[-1] < x:
+        raise ValueError
+    if not a[0] < x:
+        return 0
+    return bisect_left_fast(a, x)
+
+
+def find_ge_interp(a: list[float], x: float, window: int = 8) -> int:
+    """
+    Find leftmost item greater than or equal to x, starting from a guess
+    obtained by linear interpolation between a[0] and a[-1].
+
+    This is faster than find_ge for near-uniformly spaced data (e.g.,
+    energy or k-point grids). If the guess misses, a bisection limited to
+    a window around the guess is done, falling back to the remaining side
+    of the sequence, so non-uniform data is never much slower than find_ge.
+
+    Args:
+        a (list[float]): Sorted sequence to search.
+        x (float): Value to locate.
+        window (int): Half width of the bisection window around the guess.
+    """
+    n = len(a)
+    if n == 0 or x > a[-1]:
+        raise ValueError
+    if x <= a[0]:
+        return 0
+    # Unless x is NaN, a[0] < x <= a[-1] here and the span is positive.
+    # There is no guess for a NaN x, a zero span or an infinite endpoint.
+    span = a[-1] - a[0]
+    if not a[0] < x or not span > 0:
+        return bs.bisect_left(a, x)
+    pos = (x - a[0]) / span * (n - 1)
+    if not math.isfinite(pos):
+        return bs.bisect_left(a, x)
+    guess = min(max(int(pos), 1), n - 1)
+    if a[guess - 1] < x <= a[guess]:
+        return guess
+
+    lo, hi = max(0, guess - window), min(n, guess + window)
+    if a[lo] >= x:
+        lo, hi = 0, lo
+    elif a[hi - 1] < x:
+        lo, hi = hi, n
+    return bs.bisect_left(a, x, lo, hi)
+
+
+class BisectCursor:
+    """
+    Sorted-sequence lookups that remember the position of the previous hit.
+
+    Successive queries that are close to each other (e.g., a sorted or
+    nearly sorted stream of needles in binning or interpolation workloads)
+    are resolved by probing the neighbourhood of the last hit, which
+    usually takes one to three comparisons. Only on a miss is a bisection
+    performed, restricted to the side of the last hit where the answer lies.
+
+    The sequence must not be modified while the cursor is in use.
+
+    Examples:
+        >>> cursor = BisectCursor([0, 1, 2, 3, 4])
+        >>> [cursor.find_ge(x) for x in (0.5, 1.5, 2.5)]
+        [1, 2, 3]
+    """
+
+    def __init__(self, a: list[float]) -> None:
+        """
+        Args:
+            a (list[float]): Sorted sequence to search.
+        """
+        self.a = a
+        self.last_idx = 0
+
+    def _bisect_left(self, x: float) -> int:
+        a, g = self.a, self.last_idx
+        n = len(a)
+        if g == 0 or a[g - 1] < x:
+            # The insertion point is at or right of the guess
+            if g == n or x <= a[g]:
+                i = g
+            elif g + 1 == n or x <= a[g + 1]:
+                i = g + 1
+            else:
+                i = bs.bisect_left(a, x, lo=g + 2)
+        elif g == 1 or a[g - 2] < x:
+            i = g - 1
+        else:
+            i = bs.bisect_left(a, x, hi=g - 2)
+        self.last_idx = i
         return i
-    raise ValueError
+
+    def _bisect_right(self, x: float) -> int:
+        a, g = self.a, self.last_idx
+        n = len(a)
+        if g == 0 or a[g - 1] <= x:
+            # The insertion point is at or right of the guess
+            if g == n or x < a[g]:
+                i = g
+            elif g + 1 == n or x < a[g + 1]:
+                i = g + 1
+            else:
+                i = bs.bisect_right(a, x, lo=g + 2)
+        elif g == 1 or a[g - 2] <= x:
+            i = g - 1
+        else:
+            i = bs.bisect_right(a, x, hi=g - 2)
+        self.last_idx = i
+        return i
+
+    def index(self, x: float, atol: Optional[float] = None) -> int:
+        """Locate the leftmost value exactly equal to x."""
+        i = self._bisect_left(x)
+        if i != len(self.a):
+            if atol is None:
+                if self.a[i] == x:
+                    return i
+            elif abs(self.a[i] - x) < atol:
+                return i
+        raise ValueError
+
+    def find_lt(self, x: float) -> int:
+        """Find rightmost value less than x."""
+        if i := self._bisect_left(x):
+            return i - 1
+        raise ValueError
+
+    def find_le(self, x: float) -> int:
+        """Find rightmost value less than or equal to x."""
+        if i := self._bisect_right(x):
+            return i - 1
+        raise ValueError
+
+    def find_gt(self, x: float) -> int:
+        """Find leftmost value greater than x."""
+        i = self._bisect_right(x)
+        if i != len(self.a):
+            return i
+        raise ValueError
+
+    def find_ge(self, x: float) -> int:
+        """Find leftmost item greater than or equal to x."""
+        i = self._bisect_left(x)
+        if i != len(self.a):
+            return i
+        raise ValueError
+
+
+CachedLookups = namedtuple(
+    "CachedLookups", ["index", "find_lt", "find_le", "find_gt", "find_ge"]
+)
+
+
+def make_cached(a: list[float], maxsize: Optional[int] = 32) -> CachedLookups:
+    """
+    Bind the lookup functions to the sorted sequence a, each behind its own
+    LRU cache. Useful when a small set of needles dominates the queries.
+
+    The sequence must not be modified while the returned functions are in
+    use, otherwise stale results are returned.
+
+    Examples:
+        >>> lookups = make_cached([0, 1, 2, 3, 4])
+        >>> lookups.find_ge(1.5)
+        2
+
+    Args:
+        a (list[float]): Sorted sequence to search.
+        maxsize (int): Size of each LRU cache, passed to functools.lru_cache.
+
+    Returns:
+        CachedLookups: namedtuple of index, find_lt, find_le, find_gt and
+            find_ge taking the same arguments as the module functions
+            without a.
+    """
+    return CachedLookups(
+        *(
+            lru_cache(maxsize=maxsize)(partial(func, a))
+            for func in (index, find_lt, find_le, find_gt, find_ge)
+        )
+    )
+
+
+def _searchsorted(a: ArrayLike, xs: ArrayLike, side: Literal["left", "right"]) -> tuple:
+    """
+    Vectorized bisect of the needles xs into the sorted sequence a.
+    If numba is installed and both a and xs are 1D float64 arrays, the
+    compiled branchless kernels are used, which outperform
+    numpy.searchsorted on large arrays.
+
+    Returns:
+        tuple: (a as ndarray, ndarray of insertion indices).
+    """
+    if np is None:
+        raise ImportError("numpy must be installed for batched bisect functions.")
+    arr = np.asarray(a)
+    xs_arr = np.asarray(xs)
+    if _is_f64_array(arr) and _is_f64_array(xs_arr):
+        kernels = _load_njit()
+        if kernels is not None:
+            if side == "left":
+                idx = kernels.bisect_left_batch(arr, xs_arr)
+            else:
+                idx = kernels.bisect_right_batch(arr, xs_arr)
+            # The kernels compare with < as bisect does, whereas
+            # searchsorted sorts NaN last. Use the latter for NaN needles,
+            # so that results do not depend on numba being installed.
+            nan_mask = np.isnan(xs_arr)
+            if nan_mask.any():
+                idx[nan_mask] = np.searchsorted(arr, xs_arr[nan_mask], side=side)
+            return arr, idx
+    return arr, np.searchsorted(arr, xs, side=side)
+
+
+def index_many(a: ArrayLike, xs: ArrayLike, atol: Optional[float] = None):
+    """
+    Batched version of index. Locate the leftmost value exactly equal to
+    each x in xs. Needles without a match are set to -1.
+    """
+    arr, idx = _searchsorted(a, xs, "left")
+    if len(arr) == 0:
+        return np.full_like(idx, -1)
+    vals = arr[np.minimum(idx, len(arr) - 1)]
+    found = np.abs(vals - xs) < atol if atol is not None else vals == xs
+    return np.where((idx != len(arr)) & found, idx, -1)
+
+
+def find_lt_many(a: ArrayLike, xs: ArrayLike):
+    """
+    Batched version of find_lt. Find rightmost value less than each x in xs.
+    Needles without a match are set to -1.
+    """
+    _arr, idx = _searchsorted(a, xs, "left")
+    return idx - 1
+
+
+def find_le_many(a: ArrayLike, xs: ArrayLike):
+    """
+    Batched version of find_le. Find rightmost value less than or equal to
+    each x in xs. Needles without a match are set to -1.
+    """
+    _arr, idx = _searchsorted(a, xs, "right")
+    return idx - 1
+
+
+def find_gt_many(a: ArrayLike, xs: ArrayLike):
+    """
+    Batched version of find_gt. Find leftmost value greater than each x in xs.
+    Needles without a match are set to -1.
+    """
+    arr, idx = _searchsorted(a, xs, "right")
+    return np.where(idx == len(arr), -1, idx)
+
+
+def find_ge_many(a: ArrayLike, xs: ArrayLike):
+    """
+    Batched version of find_ge. Find leftmost item greater than or equal to
+    each x in xs. Needles without a match are set to -1.
+    """
+    arr, idx = _searchsorted(a, xs, "left")
+    return np.where(idx == len(arr), -1, idx)
@@ -5,10 +5,11 @@ Useful collection classes, e.g., tree, frozendict, etc.
 from __future__ import annotations
 
 import collections
+import functools
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, Iterable
+    from typing import Any, Iterable, Mapping, Sequence
 
     from typing_extensions import Self
 
@@ -22,25 +23,56 @@ def tree() -> collections.defaultdict:
         x = tree()
         x['a']['b']['c'] = 1
 
+    For populating many deep paths, set_path on a plain dict is faster.
+
     Returns:
         A tree.
     """
     return collections.defaultdict(tree)
 
 
+def set_path(root: dict, keys: Sequence, value: Any) -> dict:
+    """
+    Set a value in a nested dict, creating intermediate dicts as needed.
+    This is a faster alternative to tree() for bulk population, as each level
+    is a single dict.setdefault call on a plain dict.
+
+    Usage:
+        x = {}
+        set_path(x, ("a", "b", "c"), 1)
+        # x == {'a': {'b': {'c': 1}}}
+
+    Args:
+        root (dict): Dict to populate.
+        keys (Sequence): Path of keys leading to the value.
+        value (Any): Value to set.
+
+    Returns:
+        The root dict.
+    """
+    d = root
+    for k in keys[:-1]:
+        d = d.setdefault(k, {})
+    d[keys[-1]] = value
+    return root
+
+
 class frozendict(dict):
     """
     A dictionary that does not permit changes. The naming
     violates PEP8 to be consistent with standard Python's "frozenset" naming.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Args:
             args: Passthrough arguments for standard dict.
             kwargs: Passthrough keyword arguments for standard dict.
         """
-        dict.__init__(self, *args, **kwargs)
+        # Bypass the overridden update, which forbids changes
+        dict.update(self, *args, **kwargs)
 
     def __setitem__(self, key: Any, val: Any) -> None:
         raise KeyError(f"Cannot overwrite existing key: {str(key)}")
@@ -77,8 +109,13 @@ class Namespace(dict):
             args: Passthrough arguments for standard dict.
             kwargs: Passthrough keyword arguments for standard dict.
         """
-        for k, v in dict(*args, **kwargs).items():
-            self[k] = v
+        new = dict(*args, **kwargs)
+        if existent := new.keys() & self.keys():
+            raise KeyError(
+                f"Cannot overwrite existent keys: {', '.join(map(str, existent))}"
+            )
+
+        dict.update(self, new)
 
 
 class AttrDict(dict):
@@ -119,6 +156,8 @@ class FrozenAttrDict(frozendict):
           to the traditional way obj['foo']
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Args:
@@ -163,13 +202,34 @@ class MongoDict:
         e.g MongoDict({"keys": 1}).keys would be the ABC dict method.
     """
 
+    __slots__ = ("_mongo_dict_",)
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Args:
             args: Passthrough arguments for standard dict.
             kwargs: Passthrough keyword arguments for standard dict.
         """
-        self.__dict__["_mongo_dict_"] = dict(*args, **kwargs)
+        object.__setattr__(self, "_mongo_dict_", dict(*args, **kwargs))
+
+    @classmethod
+    def _wrap(cls, mapping: Mapping) -> Self:
+        """
+        Wrap a nested mapping without copying it, which makes wrapping
+        O(1) and keeps the wrapper in sync with the mapping. Subclasses
+        overriding __init__ get it called instead, at the cost of a copy.
+        """
+        if cls.__init__ is not MongoDict.__init__:
+            return cls(mapping)
+        wrapper = cls.__new__(cls)
+        object.__setattr__(wrapper, "_mongo_dict_", mapping)
+        return wrapper
+
+    def __getstate__(self) -> dict:
+        return self._mongo_dict_
+
+    def __setstate__(self, state: dict) -> None:
+        object.__setattr__(self, "_mongo_dict_", state)
 
     def __repr__(self) -> str:
         return str(self)
@@ -182,18 +242,18 @@ class MongoDict:
             f"You cannot modify attribute {name} of {self.__class__.__name__}"
         )
 
-    def __getattribute__(self, name: str) -> Any:
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the regular attribute lookup fails
+        if name in MongoDict.__slots__:
+            # Slot not set yet, e.g. while unpickling
+            raise AttributeError(name)
         try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            # raise
-            try:
-                a = self._mongo_dict_[name]
-                if isinstance(a, collections.abc.Mapping):
-                    a = self.__class__(a)
-                return a
-            except Exception as exc:
-                raise AttributeError(str(exc))
+            a = self._mongo_dict_[name]
+            if isinstance(a, collections.abc.Mapping):
+                return self._wrap(a)
+            return a
+        except Exception as exc:
+            raise AttributeError(str(exc))
 
     def __getitem__(self, slice_) -> Any:
         return self._mongo_dict_.__getitem__(slice_)
@@ -224,16 +284,17 @@ def dict2namedtuple(*args, **kwargs) -> tuple:
         >>> assert t[0] == t.foo and t[1] == t.bar
 
     Warnings:
-        - The order of the items in the namedtuple is not deterministic if
-          kwargs are used.
-          namedtuples, however, should always be accessed by attribute hence
-          this behaviour should not represent a serious problem.
-
         - Don't use this function in code in which memory and performance are
           crucial since a dict is needed to instantiate the tuple!
     """
-    d = collections.OrderedDict(*args)
-    d.update(**kwargs)
-    return collections.namedtuple(
-        typename="dict2namedtuple", field_names=list(d.keys())
-    )(**d)
+    d = dict(*args, **kwargs)
+    return _namedtuple_class(tuple(d))(**d)
+
+
+@functools.lru_cache(maxsize=256)
+def _namedtuple_class(field_names: tuple) -> type:
+    """
+    Cached namedtuple class factory for dict2namedtuple, as creating a
+    namedtuple class is slow.
+    """
+    return collections.namedtuple(typename="dict2namedtuple", field_names=field_names)
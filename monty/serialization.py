@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from typing import TYPE_CHECKING
 
 try:
@@ -23,9 +24,98 @@ try:
 except ImportError:
     msgpack = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 if TYPE_CHECKING:
     from pathlib import Path
-    from typing import Any, Optional, Union
+    from typing import IO, Any, Optional, Union
+
+_FMT_BY_EXT = {".json": "json", ".yaml": "yaml", ".yml": "yaml", ".mpk": "mpk"}
+_COMPRESSION_EXTS = {".bz2", ".gz", ".z", ".xz", ".lzma"}
+_PLAIN_EXTS = (".json", ".yaml", ".yml", ".mpk")
+
+_yaml_local = threading.local()
+
+
+def _get_yaml() -> YAML:
+    """
+    Get a YAML instance, created on first use and reused afterwards.
+    YAML instances can be reused but are not thread-safe, so one is kept
+    per thread. They are left in a broken state by a failed load or dump,
+    after which _drop_yaml must be called.
+    """
+    try:
+        return _yaml_local.yaml
+    except AttributeError:
+        _yaml_local.yaml = YAML()
+        return _yaml_local.yaml
+
+
+def _drop_yaml() -> None:
+    """Discard the YAML instance of the current thread."""
+    _yaml_local.__dict__.pop("yaml", None)
+
+
+def _fast_open(fn: Union[str, Path], mode: str) -> IO:
+    """
+    Open fn with the builtin open if it has an uncompressed extension known
+    to loadfn/dumpfn, skipping the compression detection of zopen.
+    """
+    fn = os.fspath(fn)
+    if fn.endswith(_PLAIN_EXTS):
+        return open(fn, mode)  # pylint: disable=R1732
+    return zopen(fn, mode)
+
+
+def _get_fmt(fn: Union[str, Path]) -> str:
+    """
+    Detect the format of a file from its extension (case insensitive),
+    ignoring a trailing compression extension. JSON is assumed for unknown
+    extensions.
+    """
+    root, ext = os.path.splitext(os.fspath(fn))
+    ext = ext.lower()
+    if ext in _COMPRESSION_EXTS:
+        ext = os.path.splitext(root)[1].lower()
+    return _FMT_BY_EXT.get(ext, "json")
+
+
+def _is_plain(obj: Any) -> bool:
+    """
+    Check whether obj is made only of types for which orjson writes JSON
+    that loads back to the same data as json.dumps with MontyEncoder: dicts
+    with ASCII str keys, lists, ASCII str, 64-bit int, finite float, bool
+    and None. The text itself differs in whitespace and float formatting.
+    Exact types are required, as orjson natively handles types (e.g.,
+    datetime, dataclasses, enums) that MontyEncoder serializes differently.
+    """
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+        if obj_type is dict:
+            for key in obj:
+                if type(key) is not str or not key.isascii():
+                    return False
+            stack.extend(obj.values())
+        elif obj_type is list:
+            stack.extend(obj)
+        elif obj_type is str:
+            if not obj.isascii():
+                return False
+        elif obj_type is float:
+            # False for inf and nan, which orjson writes as null
+            if obj - obj != 0:
+                return False
+        elif obj_type is int:
+            if not -(2**63) <= obj < 2**64:
+                return False
+        elif obj_type is not bool and obj is not None:
+            return False
+    return True
 
 
 def loadfn(fn: Union[str, Path], *args, fmt: Optional[str] = None, **kwargs) -> Any:
@@ -34,9 +124,10 @@ def loadfn(fn: Union[str, Path], *args, fmt: Optional[str] = None, **kwargs) ->
     File-like object. File may also be a BZ2 (".BZ2") or GZIP (".GZ", ".Z")
     compressed file.
     For YAML, ruamel.yaml must be installed. The file type is automatically
-    detected from the file extension (case insensitive).
-    YAML is assumed if the filename contains ".yaml" or ".yml".
-    Msgpack is assumed if the filename contains ".mpk".
+    detected from the file extension (case insensitive), ignoring any
+    compression extension.
+    YAML is assumed if the extension is ".yaml" or ".yml".
+    Msgpack is assumed if the extension is ".mpk".
     JSON is otherwise assumed.
 
     Args:
@@ -52,13 +143,7 @@ def loadfn(fn: Union[str, Path], *args, fmt: Optional[str] = None, **kwargs) ->
     """
 
     if fmt is None:
-        basename = os.path.basename(fn).lower()
-        if ".mpk" in basename:
-            fmt = "mpk"
-        elif any(ext in basename for ext in (".yaml", ".yml")):
-            fmt = "yaml"
-        else:
-            fmt = "json"
+        fmt = _get_fmt(fn)
 
     if fmt == "mpk":
         if msgpack is None:
@@ -67,15 +152,19 @@ def loadfn(fn: Union[str, Path], *args, fmt: Optional[str] = None, **kwargs) ->
             )
         if "object_hook" not in kwargs:
             kwargs["object_hook"] = object_hook
-        with zopen(fn, "rb") as fp:
+        with _fast_open(fn, "rb") as fp:
             return msgpack.load(fp, *args, **kwargs)  # pylint: disable=E1101
     else:
-        with zopen(fn, "rt") as fp:
+        with _fast_open(fn, "rt") as fp:
             if fmt == "yaml":
                 if YAML is None:
                     raise RuntimeError("Loading of YAML files requires ruamel.yaml.")
-                yaml = YAML()
-                return yaml.load(fp, *args, **kwargs)
+                yaml = _get_yaml()
+                try:
+                    return yaml.load(fp, *args, **kwargs)
+                except BaseException:
+                    _drop_yaml()
+                    raise
             if fmt == "json":
                 if "cls" not in kwargs:
                     kwargs["cls"] = MontyDecoder
@@ -84,34 +173,42 @@ def loadfn(fn: Union[str, Path], *args, fmt: Optional[str] = None, **kwargs) ->
             raise TypeError(f"Invalid format: {fmt}")
 
 
-def dumpfn(obj: object, fn: Union[str, Path], *args, fmt=None, **kwargs) -> None:
+def dumpfn(
+    obj: object,
+    fn: Union[str, Path],
+    *args,
+    fmt=None,
+    use_orjson: bool = False,
+    **kwargs,
+) -> None:
     """
     Dump to a json/yaml directly by filename instead of a
     File-like object. File may also be a BZ2 (".BZ2") or GZIP (".GZ", ".Z")
     compressed file.
     For YAML, ruamel.yaml must be installed. The file type is automatically
-    detected from the file extension (case insensitive). YAML is assumed if the
-    filename contains ".yaml" or ".yml".
-    Msgpack is assumed if the filename contains ".mpk".
+    detected from the file extension (case insensitive), ignoring any
+    compression extension. YAML is assumed if the extension is ".yaml" or
+    ".yml".
+    Msgpack is assumed if the extension is ".mpk".
     JSON is otherwise assumed.
 
     Args:
         obj (object): Object to dump.
         fn (str/Path): filename or pathlib.Path.
         *args: Any of the args supported by json/yaml.dump.
+        use_orjson (bool): Write JSON with orjson, which is several times
+            faster, if orjson is installed, no args or kwargs are given and
+            obj is made only of dicts, lists, str, int, float, bool and None.
+            The output is compact (no whitespace) and floats are formatted
+            by orjson (e.g., 1e16 instead of 1e+16), so the file differs
+            from the default output but loads back to the same data.
         **kwargs: Any of the kwargs supported by json/yaml.dump.
 
     Returns:
         (object) Result of json.load.
     """
     if fmt is None:
-        basename = os.path.basename(fn).lower()
-        if ".mpk" in basename:
-            fmt = "mpk"
-        elif any(ext in basename for ext in (".yaml", ".yml")):
-            fmt = "yaml"
-        else:
-            fmt = "json"
+        fmt = _get_fmt(fn)
 
     if fmt == "mpk":
         if msgpack is None:
@@ -120,18 +217,37 @@ def dumpfn(obj: object, fn: Union[str, Path], *args, fmt=None, **kwargs) -> None
             )
         if "default" not in kwargs:
             kwargs["default"] = default
-        with zopen(fn, "wb") as fp:
+        with _fast_open(fn, "wb") as fp:
             msgpack.dump(obj, fp, *args, **kwargs)  # pylint: disable=E1101
+    elif (
+        use_orjson
+        and fmt == "json"
+        and orjson is not None
+        and not args
+        and not kwargs
+        and _is_plain(obj)
+    ):
+        # orjson is several times faster than json for plain data. Its output
+        # is ASCII-only bytes here, so it is written as is, without the extra
+        # copies made by decoding to str and re-encoding in text mode.
+        with _fast_open(fn, "wb") as fp:
+            fp.write(orjson.dumps(obj))  # pylint: disable=E1101
     else:
-        with zopen(fn, "wt") as fp:
+        with _fast_open(fn, "wt") as fp:
             if fmt == "yaml":
                 if YAML is None:
                     raise RuntimeError("Loading of YAML files requires ruamel.yaml.")
-                yaml = YAML()
-                yaml.dump(obj, fp, *args, **kwargs)
+                yaml = _get_yaml()
+                try:
+                    yaml.dump(obj, fp, *args, **kwargs)
+                except BaseException:
+                    _drop_yaml()
+                    raise
             elif fmt == "json":
                 if "cls" not in kwargs:
                     kwargs["cls"] = MontyEncoder
+                # json.dumps rather than json.dump, as only the one-shot
+                # encoding uses the C accelerated encoder.
                 fp.write(json.dumps(obj, *args, **kwargs))
             else:
                 raise TypeError(f"Invalid format: {fmt}")
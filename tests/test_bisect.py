@@ -1,6 +1,35 @@
 from __future__ import annotations
 
-from monty.bisect import find_ge, find_gt, find_le, find_lt, index
+import pytest
+
+from monty.bisect import (
+    _NJIT_MIN_SIZE,
+    BisectCursor,
+    bisect_left_fast,
+    bisect_right_fast,
+    find_ge,
+    find_ge_interp,
+    find_ge_many,
+    find_gt,
+    find_gt_many,
+    find_le,
+    find_le_many,
+    find_lt,
+    find_lt_many,
+    index,
+    index_many,
+    make_cached,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from monty import _bisect_njit
+except ImportError:
+    _bisect_njit = None
 
 
 def test_funcs():
@@ -11,3 +40,185 @@ def test_funcs():
     assert find_le(line, 1) == 1
     assert find_ge(line, 2) == 2
     # assert index([0, 1, 1.5, 2], 1.501, atol=0.1) == 4
+
+    # Out-of-range queries
+    assert find_lt(line, 10) == 4
+    assert find_le(line, 4) == 4
+    assert find_gt(line, -1) == 0
+    assert find_ge(line, 0) == 0
+    for func in (index, find_gt, find_ge):
+        with pytest.raises(ValueError):
+            func(line, 5)
+    for func in (index, find_lt, find_le):
+        with pytest.raises(ValueError):
+            func(line, -1)
+
+
+@pytest.mark.parametrize("line", [[], [1], [1, 1]])
+def test_funcs_tiny(line):
+    import bisect
+
+    for x in (0, 1, 2):
+        for func, expected in [
+            (index, bisect.bisect_left(line, x)),
+            (find_lt, bisect.bisect_left(line, x) - 1),
+            (find_le, bisect.bisect_right(line, x) - 1),
+            (find_gt, bisect.bisect_right(line, x)),
+            (find_ge, bisect.bisect_left(line, x)),
+        ]:
+            valid = 0 <= expected < len(line)
+            if func is index:
+                valid = valid and line[expected] == x
+            if valid:
+                assert func(line, x) == expected
+            else:
+                with pytest.raises(ValueError):
+                    func(line, x)
+    if line:
+        assert index(line, 0.95, atol=0.1) == 0
+
+
+@pytest.mark.skipif(np is None, reason="numpy not present")
+def test_funcs_ndarray():
+    line = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+    assert index(line, 1) == 1
+    assert find_lt(line, 1) == 0
+    assert find_gt(line, 1) == 2
+    assert find_le(line, 1) == 1
+    assert find_ge(line, 2) == 2
+    assert isinstance(find_ge(line, 2), int)
+    with pytest.raises(ValueError):
+        find_gt(line, 4)
+    with pytest.raises(ValueError):
+        find_lt(line, 0)
+
+
+@pytest.mark.skipif(_bisect_njit is None, reason="numba not present")
+def test_njit_kernels():
+    import bisect
+
+    for line in ([], [1.0], [0.0, 1.0, 1.0, 2.0, 3.5], [1.0] * 4):
+        line = np.array(line)
+        for x in (-1, 0, 0.5, 1, 1.5, 3.5, 4):
+            assert _bisect_njit.bisect_left(line, x) == bisect.bisect_left(line, x)
+            assert _bisect_njit.bisect_right(line, x) == bisect.bisect_right(line, x)
+            assert bisect_left_fast(line, x) == bisect.bisect_left(line, x)
+            assert bisect_right_fast(line, x) == bisect.bisect_right(line, x)
+
+        xs = np.array([-1, 0, 0.5, 1, 1.5, 3.5, 4])
+        left = _bisect_njit.bisect_left_batch(line, xs)
+        right = _bisect_njit.bisect_right_batch(line, xs)
+        assert left.tolist() == np.searchsorted(line, xs, side="left").tolist()
+        assert right.tolist() == np.searchsorted(line, xs, side="right").tolist()
+        xs = np.append(xs, np.nan)
+        for func in (
+            index_many,
+            find_lt_many,
+            find_le_many,
+            find_gt_many,
+            find_ge_many,
+        ):
+            fallback = func(line.astype(np.float32), xs)
+            assert func(line, xs).tolist() == fallback.tolist()
+            assert func(line, xs.tolist()).tolist() == fallback.tolist()
+
+    # Arrays above the size threshold are dispatched to the kernels
+    line = np.sort(np.random.default_rng(0).uniform(size=2 * _NJIT_MIN_SIZE))
+    for x in (-1, line[0], line[100], 0.5, line[-1], 2):
+        assert bisect_left_fast(line, x) == bisect.bisect_left(line, x)
+        assert bisect_right_fast(line, x) == bisect.bisect_right(line, x)
+
+
+def test_find_ge_interp():
+    uniform = [0.1 * i for i in range(100)]
+    skewed = [i**4 for i in range(100)]
+    for line in (uniform, skewed, [0, 0, 0, 1, 1, 5], [2.0]):
+        for x in [line[0] - 1, *line, *(0.5 * (u + v) for u, v in zip(line, line[1:]))]:
+            assert find_ge_interp(line, x) == find_ge(line, x)
+            assert find_ge_interp(line, x, window=1) == find_ge(line, x)
+        with pytest.raises(ValueError):
+            find_ge_interp(line, line[-1] + 1)
+    with pytest.raises(ValueError):
+        find_ge_interp([], 1)
+
+    # Non-finite values cannot be interpolated
+    inf = float("inf")
+    for line, x in [
+        ([0, 1, inf], inf),
+        ([0, 1, inf], 0.5),
+        ([-inf, 0, 1], 0.5),
+        ([-inf, 0, inf], 0),
+        ([0, 1, 2], float("nan")),
+        ([2.0], float("nan")),
+        ([1, 1], float("nan")),
+    ]:
+        assert find_ge_interp(line, x) == find_ge(line, x)
+
+
+def test_bisect_cursor():
+    line = [0, 1, 1, 2, 3, 5, 8, 13]
+    # Sorted, reversed, repeated and jumping queries all agree with the
+    # stateless functions.
+    queries = [-1, 0, 0.5, 1, 1, 1.5, 2, 4, 13, 20, 12, 7, 1, 0, -5, 6, 2.5, 2.5]
+    cursor = BisectCursor(line)
+    for x in queries:
+        for name, func in [
+            ("index", index),
+            ("find_lt", find_lt),
+            ("find_le", find_le),
+            ("find_gt", find_gt),
+            ("find_ge", find_ge),
+        ]:
+            try:
+                expected = func(line, x)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    getattr(cursor, name)(x)
+            else:
+                assert getattr(cursor, name)(x) == expected
+    assert cursor.index(4.9, atol=0.2) == 5
+
+    with pytest.raises(ValueError):
+        BisectCursor([]).find_ge(1)
+
+
+def test_make_cached():
+    line = [0, 1, 2, 3, 4]
+    lookups = make_cached(line)
+    for _ in range(2):
+        assert lookups.index(1) == 1
+        assert lookups.index(0.99, atol=0.1) == 1
+        assert lookups.find_lt(1) == 0
+        assert lookups.find_gt(1) == 2
+        assert lookups.find_le(1) == 1
+        assert lookups.find_ge(2) == 2
+    assert lookups.find_ge.cache_info().hits == 1
+    with pytest.raises(ValueError):
+        lookups.find_lt(0)
+
+
+@pytest.mark.skipif(np is None, reason="numpy not present")
+def test_funcs_many():
+    line = [0, 1, 2, 3, 4]
+    xs = np.array([-1, 1, 1.5, 4, 5])
+    assert index_many(line, xs).tolist() == [-1, 1, -1, 4, -1]
+    assert index_many(line, xs, atol=0.6).tolist() == [-1, 1, 2, 4, -1]
+    assert find_lt_many(line, xs).tolist() == [-1, 0, 1, 3, 4]
+    assert find_le_many(line, xs).tolist() == [-1, 1, 1, 4, 4]
+    assert find_gt_many(line, xs).tolist() == [0, 2, 2, -1, -1]
+    assert find_ge_many(line, xs).tolist() == [0, 1, 2, 4, -1]
+    assert index_many([], xs).tolist() == [-1] * 5
+
+    # Batched results agree with the scalar functions
+    for func, func_many in [
+        (find_lt, find_lt_many),
+        (find_le, find_le_many),
+        (find_gt, find_gt_many),
+        (find_ge, find_ge_many),
+    ]:
+        for x, i in zip(xs, func_many(line, xs)):
+            if i == -1:
+                with pytest.raises(ValueError):
+                    func(line, x)
+            else:
+                assert func(line, x) == i
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import copy
 import os
+import pickle
 
 import pytest
 
-from monty.collections import AttrDict, FrozenAttrDict, Namespace, frozendict, tree
+from monty.collections import (
+    AttrDict,
+    FrozenAttrDict,
+    MongoDict,
+    Namespace,
+    dict2namedtuple,
+    frozendict,
+    set_path,
+    tree,
+)
 
 test_dir = os.path.join(os.path.dirname(__file__), "test_files")
 
@@ -15,6 +26,10 @@ class TestFrozenDict:
         with pytest.raises(KeyError):
             d["k"] == "v"
         assert d["hello"] == "world"
+        assert frozendict([("a", 1)], b=2) == {"a": 1, "b": 2}
+        assert not hasattr(d, "__dict__")
+        with pytest.raises(KeyError):
+            d.update(a=1)
 
     def test_namespace_dict(self):
         d = Namespace(foo="bar")
@@ -22,6 +37,11 @@ class TestFrozenDict:
         assert d["foo"] == "bar"
         with pytest.raises(KeyError):
             d.update({"foo": "spam"})
+        with pytest.raises(KeyError, match="foo"):
+            d.update({"new": 1, "foo": "spam"})
+        assert "new" not in d
+        d.update([("spam", 1)], eggs=2)
+        assert d["spam"] == 1 and d["eggs"] == 2
 
     def test_attr_dict(self):
         d = AttrDict(foo=1, bar=2)
@@ -45,6 +65,47 @@ class TestFrozenDict:
             d.hello = "new"
 
 
+class TestMongoDict:
+    def test_mongo_dict(self):
+        m = MongoDict({"a": {"b": 1}, "x": 2, "keys": 3})
+        assert m.a.b == 1 and m.x == 2 and m.keys == 3
+        assert isinstance(m.a, MongoDict)
+        assert "a" in m and "b" in m.a
+        assert m["a"] == {"b": 1}
+        assert len(m) == 3
+        assert dir(m) == ["a", "keys", "x"]
+        assert not hasattr(m, "__dict__")
+        with pytest.raises(AttributeError):
+            m.missing
+        with pytest.raises(NotImplementedError):
+            m.x = 3
+
+    def test_nested_wrapper_in_sync(self):
+        m = MongoDict({"a": {"b": {"c": 1}}, "_wrappers_": 2})
+        assert m._wrappers_ == 2
+        b = m.a.b
+        m["a"]["b"]["c"] = 2
+        assert b.c == 2 and m.a.b.c == 2
+        m["a"]["b"] = {"c": 3}
+        assert m.a.b.c == 3
+
+    def test_subclass_init(self):
+        class TaggedDict(MongoDict):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, tag=1, **kwargs)
+
+        m = TaggedDict({"a": {"b": 1}})
+        assert isinstance(m.a, TaggedDict)
+        assert m.a.tag == 1 and m.a.b == 1
+        m["a"]["b"] = 2
+        assert m.a.b == 2
+
+    def test_copy_pickle(self):
+        m = MongoDict({"a": {"b": 1}})
+        for m2 in (copy.copy(m), copy.deepcopy(m), pickle.loads(pickle.dumps(m))):
+            assert m2.a.b == 1
+
+
 class TestTree:
     def test_tree(self):
         x = tree()
@@ -53,3 +114,20 @@ class TestTree:
         assert "c" not in x["a"]
         assert "c" in x["a"]["b"]
         assert x["a"]["b"]["c"]["d"] == 1
+
+    def test_set_path(self):
+        x = {}
+        assert set_path(x, ["a", "b", "c"], 1) is x
+        set_path(x, ("a", "b", "d"), 2)
+        set_path(x, ("e",), 3)
+        assert x == {"a": {"b": {"c": 1, "d": 2}}, "e": 3}
+
+
+class TestDict2NamedTuple:
+    def test_dict2namedtuple(self):
+        t = dict2namedtuple(foo=1, bar="hello")
+        assert t.foo == 1 and t.bar == "hello"
+        t2 = dict2namedtuple([("bar", "hello"), ("foo", 1)])
+        assert t2[0] == t2.bar and t2[1] == t2.foo
+        assert type(dict2namedtuple(foo=2, bar="world")) is type(t)
+        assert type(t2) is not type(t)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import bz2
+import gzip
+import io
 import os
 import unittest
 
@@ -20,32 +23,57 @@ from monty.io import (
 
 test_dir = os.path.join(os.path.dirname(__file__), "test_files")
 
+# bz2 is the slowest codec. Deselect these cases with -m "not slow".
+slow = pytest.mark.slow
+
+
+# Number of lines of the generated test file. The file is far below the
+# default max_mem of reverse_readline, so it is read in RAM unless max_mem
+# is lowered explicitly.
+NUMLINES = 200
+REVERSED_NUMBERS = list(range(NUMLINES, 0, -1))
+
+
+@pytest.fixture(scope="session")
+def lines_bytes():
+    """Line numbers 1 to NUMLINES, without a trailing newline."""
+    return "\n".join(str(i) for i in range(1, NUMLINES + 1)).encode()
+
+
+@pytest.fixture(scope="session")
+def lines_dir(tmp_path_factory, lines_bytes):
+    """Directory with lines.txt and its gzip and bz2 compressed versions."""
+    path = tmp_path_factory.mktemp("lines")
+    (path / "lines.txt").write_bytes(lines_bytes)
+    (path / "lines.txt.gz").write_bytes(gzip.compress(lines_bytes))
+    (path / "lines.txt.bz2").write_bytes(bz2.compress(lines_bytes))
+    return path
 
-class TestReverseReadline:
-    NUMLINES = 3000
 
-    def test_reverse_readline(self):
+class TestReverseReadline:
+    def test_reverse_readline(self, lines_dir):
         """
         We are making sure a file containing line numbers is read in reverse
         order, i.e. the first line that is read corresponds to the last line.
         number
         """
-        with open(os.path.join(test_dir, "3000_lines.txt")) as f:
-            for idx, line in enumerate(reverse_readline(f)):
-                assert (
-                    int(line) == self.NUMLINES - idx
-                ), f"read_backwards read {line} whereas it should have read {self.NUMLINES - idx}"
+        with open(lines_dir / "lines.txt") as f:
+            lines = list(reverse_readline(f))
+        # Checking the type of the first line is enough
+        assert isinstance(lines[0], str)
+        assert list(map(int, lines)) == REVERSED_NUMBERS
 
-    def test_reverse_readline_fake_big(self):
+    def test_block_reader_path(self, lines_bytes):
         """
-        Make sure that large textfiles are read properly
+        Make sure that large textfiles are read properly, by forcing the
+        backwards block reading with small max_mem and blk_size.
         """
-        with open(os.path.join(test_dir, "3000_lines.txt")) as f:
-            for idx, line in enumerate(reverse_readline(f, max_mem=0)):
-                assert (
-                    int(line) == self.NUMLINES - idx
-                ), f"read_backwards read {line} whereas it should have read {self.NUMLINES - idx}"
+        with io.TextIOWrapper(io.BytesIO(lines_bytes)) as f:
+            lines = list(reverse_readline(f, blk_size=64, max_mem=64))
+        assert isinstance(lines[0], str)
+        assert list(map(int, lines)) == REVERSED_NUMBERS
 
+    @slow
     def test_reverse_readline_bz2(self):
         """
         We are making sure a file containing line numbers is read in reverse
@@ -53,53 +81,35 @@ class TestReverseReadline:
         number
         """
         lines = []
-        with zopen(os.path.join(test_dir, "myfile_bz2.bz2"), "rb") as f:
+        with bz2.BZ2File(io.BytesIO(bz2.compress(b"HelloWorld.\n\n"))) as f:
             for line in reverse_readline(f):
                 lines.append(line.strip())
-        assert lines[-1].strip(), ["HelloWorld." in b"HelloWorld."]
+        assert lines[-1] == "HelloWorld."
 
     def test_empty_file(self):
         """
         make sure an empty file does not throw an error when reverse_readline
         is called this was a problem with an earlier implementation
         """
-        with open(os.path.join(test_dir, "empty_file.txt")) as f:
+        with io.TextIOWrapper(io.BytesIO(b"")) as f:
             for _line in reverse_readline(f):
                 raise ValueError("an empty file is being read!")
 
 
 class TestReverseReadfile:
-    NUMLINES = 3000
-
-    def test_reverse_readfile(self):
+    @pytest.mark.parametrize(
+        "fname",
+        ["lines.txt", "lines.txt.gz", pytest.param("lines.txt.bz2", marks=slow)],
+    )
+    def test_reverse_readfile(self, lines_dir, fname):
         """
         We are making sure a file containing line numbers is read in reverse
         order, i.e. the first line that is read corresponds to the last line.
         number
         """
-        fname = os.path.join(test_dir, "3000_lines.txt")
-        for idx, line in enumerate(reverse_readfile(fname)):
-            assert int(line) == self.NUMLINES - idx
-
-    def test_reverse_readfile_gz(self):
-        """
-        We are making sure a file containing line numbers is read in reverse
-        order, i.e. the first line that is read corresponds to the last line.
-        number
-        """
-        fname = os.path.join(test_dir, "3000_lines.txt.gz")
-        for idx, line in enumerate(reverse_readfile(fname)):
-            assert int(line) == self.NUMLINES - idx
-
-    def test_reverse_readfile_bz2(self):
-        """
-        We are making sure a file containing line numbers is read in reverse
-        order, i.e. the first line that is read corresponds to the last line.
-        number
-        """
-        fname = os.path.join(test_dir, "3000_lines.txt.bz2")
-        for idx, line in enumerate(reverse_readfile(fname)):
-            assert int(line) == self.NUMLINES - idx
+        lines = list(reverse_readfile(lines_dir / fname))
+        assert isinstance(lines[0], str)
+        assert list(map(int, lines)) == REVERSED_NUMBERS
 
     def test_empty_file(self):
         """
@@ -111,18 +121,18 @@ class TestReverseReadfile:
 
 
 class TestZopen:
-    def test_zopen(self):
-        with zopen(os.path.join(test_dir, "myfile_gz.gz"), mode="rt") as f:
-            assert f.read() == "HelloWorld.\n\n"
-        with zopen(os.path.join(test_dir, "myfile_bz2.bz2"), mode="rt") as f:
-            assert f.read() == "HelloWorld.\n\n"
-        with zopen(os.path.join(test_dir, "myfile_bz2.bz2"), "rt") as f:
-            assert f.read() == "HelloWorld.\n\n"
-        with zopen(os.path.join(test_dir, "myfile_xz.xz"), "rt") as f:
-            assert f.read() == "HelloWorld.\n\n"
-        with zopen(os.path.join(test_dir, "myfile_lzma.lzma"), "rt") as f:
-            assert f.read() == "HelloWorld.\n\n"
-        with zopen(os.path.join(test_dir, "myfile"), mode="rt") as f:
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "myfile_gz.gz",
+            pytest.param("myfile_bz2.bz2", marks=slow),
+            "myfile_xz.xz",
+            "myfile_lzma.lzma",
+            "myfile",
+        ],
+    )
+    def test_zopen(self, name):
+        with zopen(os.path.join(test_dir, name), mode="rt") as f:
             assert f.read() == "HelloWorld.\n\n"
 
     @unittest.skipIf(Path is None, "Not Py3k")
@@ -134,15 +144,17 @@ class TestZopen:
 
 
 class TestFileLock:
-    def setup_method(self):
-        self.file_name = "__lock__"
-        self.lock = FileLock(self.file_name, timeout=1)
-        self.lock.acquire()
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def lock(cls, tmp_path_factory):
+        # The lock is held once for the whole class
+        cls.file_name = str(tmp_path_factory.mktemp("lock") / "__lock__")
+        lock = FileLock(cls.file_name, timeout=1)
+        lock.acquire()
+        yield lock
+        lock.release()
 
     def test_raise(self):
         with pytest.raises(FileLockException):
-            new_lock = FileLock(self.file_name, timeout=1)
+            new_lock = FileLock(self.file_name, timeout=0.1)
             new_lock.acquire()
-
-    def teardown_method(self):
-        self.lock.release()
@@ -28,11 +28,11 @@ class TestPath:
 
     def test_find_exts(self):
         assert len(find_exts(module_dir, "py")) >= 18
-        assert len(find_exts(module_dir, "bz2")) == 2
+        assert len(find_exts(module_dir, "bz2")) == 1
         n_bz2_excl_tests = len(find_exts(module_dir, "bz2", exclude_dirs="test_files"))
         assert n_bz2_excl_tests == 0
         n_bz2_w_tests = find_exts(module_dir, "bz2", include_dirs="test_files")
-        assert len(n_bz2_w_tests) == 2
+        assert len(n_bz2_w_tests) == 1
 
 
 class TestCd:
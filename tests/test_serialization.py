@@ -1,30 +1,38 @@
 from __future__ import annotations
 
-import glob
+import datetime
+import gzip
 import json
+import math
 import os
 import unittest
 
 import pytest
+from ruamel.yaml.error import YAMLError
+from ruamel.yaml.representer import RepresenterError
 
 try:
     import msgpack
 except ImportError:
     msgpack = None
 
-from monty.serialization import dumpfn, loadfn
-from monty.tempfile import ScratchDir
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from monty.serialization import (
+    _fast_open,
+    _get_fmt,
+    _get_yaml,
+    _is_plain,
+    dumpfn,
+    loadfn,
+)
 
 
 class TestSerial:
-    @classmethod
-    def teardown_class(cls):
-        # Cleans up test files if a test fails
-        files_to_clean_up = glob.glob("monte_test.*")
-        for fn in files_to_clean_up:
-            os.remove(fn)
-
-    def test_dumpfn_loadfn(self):
+    def test_dumpfn_loadfn(self, tmp_path):
         d = {"hello": "world"}
 
         # Test standard configuration
@@ -37,51 +45,145 @@ class TestSerial:
             "json.bz2",
             "yaml.bz2",
         ):
-            fn = f"monte_test.{ext}"
+            fn = tmp_path / f"monte_test.{ext}"
             dumpfn(d, fn)
             d2 = loadfn(fn)
             assert d == d2, f"Test file with extension {ext} did not parse correctly"
-            os.remove(fn)
 
         # Test custom kwarg configuration
-        dumpfn(d, "monte_test.json", indent=4)
-        d2 = loadfn("monte_test.json")
+        dumpfn(d, tmp_path / "monte_test.json", indent=4)
+        d2 = loadfn(tmp_path / "monte_test.json")
         assert d == d2
-        os.remove("monte_test.json")
-        dumpfn(d, "monte_test.yaml")
-        d2 = loadfn("monte_test.yaml")
+        dumpfn(d, tmp_path / "monte_test.yaml")
+        d2 = loadfn(tmp_path / "monte_test.yaml")
         assert d == d2
-        os.remove("monte_test.yaml")
 
         # Check if fmt override works.
-        dumpfn(d, "monte_test.json", fmt="yaml")
+        dumpfn(d, tmp_path / "monte_test.json", fmt="yaml")
         with pytest.raises(json.decoder.JSONDecodeError):
-            loadfn("monte_test.json")
-        d2 = loadfn("monte_test.json", fmt="yaml")
+            loadfn(tmp_path / "monte_test.json")
+        d2 = loadfn(tmp_path / "monte_test.json", fmt="yaml")
         assert d == d2
-        os.remove("monte_test.json")
 
         with pytest.raises(TypeError):
-            dumpfn(d, "monte_test.txt", fmt="garbage")
+            dumpfn(d, tmp_path / "monte_test.txt", fmt="garbage")
         with pytest.raises(TypeError):
-            loadfn("monte_test.txt", fmt="garbage")
+            loadfn(tmp_path / "monte_test.txt", fmt="garbage")
+
+    def test_get_fmt(self):
+        for fn, fmt in [
+            ("a.json", "json"),
+            ("a.JSON.GZ", "json"),
+            ("a.yaml", "yaml"),
+            ("a.yml.bz2", "yaml"),
+            ("A.YML", "yaml"),
+            ("a.mpk", "mpk"),
+            ("a.mpk.xz", "mpk"),
+            ("a.txt", "json"),
+            ("a", "json"),
+            ("dir.yaml/a.gz", "json"),
+            (os.path.join("dir.mpk", "a.json"), "json"),
+        ]:
+            assert _get_fmt(fn) == fmt, fn
+
+    def test_fast_open(self, tmp_path, monkeypatch):
+        with _fast_open(tmp_path / "monte_test.json.gz", "wt") as f:
+            assert isinstance(f.buffer, gzip.GzipFile)
+
+        # Uncompressed files must not go through zopen
+        def zopen(*args, **kwargs):
+            raise AssertionError("zopen called")
+
+        monkeypatch.setattr("monty.serialization.zopen", zopen)
+        d = {"hello": "world"}
+        for ext in ("json", "yaml", "yml", "mpk"):
+            if ext == "mpk" and msgpack is None:
+                continue
+            with _fast_open(tmp_path / f"monte_test.{ext}", "wt") as f:
+                assert not isinstance(f.buffer, gzip.GzipFile)
+            fn = tmp_path / f"monte_test2.{ext}"
+            dumpfn(d, fn)
+            assert loadfn(fn) == d
+        with pytest.raises(AssertionError, match="zopen called"):
+            _fast_open(tmp_path / "monte_test.json.gz", "wt")
+
+    def test_yaml_instance_reused(self, tmp_path):
+        assert _get_yaml() is _get_yaml()
+        d = {"hello": "world"}
+        for _ in range(2):
+            dumpfn(d, tmp_path / "monte_test.yaml")
+            assert loadfn(tmp_path / "monte_test.yaml") == d
+
+    def test_yaml_failure_recovery(self, tmp_path):
+        fn = tmp_path / "monte_test.yaml"
+        with pytest.raises(RepresenterError):
+            dumpfn({"x": object()}, fn)
+        dumpfn({"x": 1}, fn)
+        assert loadfn(fn) == {"x": 1}
+
+        fn.write_text("x: [1")
+        with pytest.raises(YAMLError):
+            loadfn(fn)
+        dumpfn({"x": 2}, fn)
+        assert loadfn(fn) == {"x": 2}
+
+    def test_is_plain(self):
+        assert _is_plain({"a": [1, 2.5, "b", None, True, {"c": []}]})
+        for obj in (
+            {1: "a"},
+            {"a": float("nan")},
+            [float("inf")],
+            [2**64],
+            ["\u00c5"],
+            (1, 2),
+            {"a": [datetime.datetime(2024, 1, 1)]},
+        ):
+            assert not _is_plain(obj)
+
+    def test_dumpfn_json_output(self, tmp_path):
+        # The default output is that of json.dumps, whether or not orjson
+        # is installed
+        fn = tmp_path / "monte_test.json"
+        dumpfn({"v": [1, 1e16]}, fn)
+        assert fn.read_text() == '{"v": [1, 1e+16]}'
+
+    @unittest.skipIf(orjson is None, "orjson not installed.")
+    def test_dumpfn_use_orjson(self, tmp_path):
+        fn = tmp_path / "monte_test.json"
+        dumpfn({"v": [1, 1e16]}, fn, use_orjson=True)
+        assert fn.read_text() == '{"v":[1,1e16]}'
+        # Extra json.dumps arguments are honoured
+        dumpfn({"v": [1, 1e16]}, fn, indent=1, use_orjson=True)
+        assert fn.read_text() == json.dumps({"v": [1, 1e16]}, indent=1)
+
+        d = {"hello": "world", "values": [1, 2.5, None, True]}
+        dumpfn(d, fn, use_orjson=True)
+        assert loadfn(fn) == d
+
+        # Objects that are not plain must still go through MontyEncoder
+        d = {"nan": float("nan"), "date": datetime.datetime(2024, 1, 1)}
+        dumpfn(d, fn, use_orjson=True)
+        d2 = loadfn(fn)
+        assert math.isnan(d2["nan"])
+        assert d2["date"] == d["date"]
+
+        d = {"unicode": "\u00c5ngstr\u00f6m", 1: 2}
+        dumpfn(d, fn, use_orjson=True)
+        assert fn.read_text(encoding="utf-8") == json.dumps(d)
 
     @unittest.skipIf(msgpack is None, "msgpack-python not installed.")
-    def test_mpk(self):
+    def test_mpk(self, tmp_path):
         d = {"hello": "world"}
 
         # Test automatic format detection
-        dumpfn(d, "monte_test.mpk")
-        d2 = loadfn("monte_test.mpk")
+        dumpfn(d, tmp_path / "monte_test.mpk")
+        d2 = loadfn(tmp_path / "monte_test.mpk")
         assert d == d2
-        os.remove("monte_test.mpk")
 
         # Test to ensure basename is respected, and not directory
-        with ScratchDir("."):
-            os.mkdir("mpk_test")
-            os.chdir("mpk_test")
-            fname = os.path.abspath("test_file.json")
-            dumpfn({"test": 1}, fname)
-            with open("test_file.json") as f:
-                reloaded = json.loads(f.read())
-            assert reloaded["test"] == 1
+        fname = tmp_path / "mpk_test" / "test_file.json"
+        fname.parent.mkdir()
+        dumpfn({"test": 1}, fname)
+        with open(fname) as f:
+            reloaded = json.loads(f.read())
+        assert reloaded["test"] == 1